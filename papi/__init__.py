@@ -1,2 +1,25 @@
-from papi.core.apps import AppSetupHook
-from papi.core.router import MPCRouter, RESTRouter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from papi.core.apps import AppSetupHook
+    from papi.core.router import MPCRouter, RESTRouter
+
+__all__ = ["AppSetupHook", "MPCRouter", "RESTRouter"]
+
+# Public names are imported on first access, so importing a submodule such as
+# `papi.cli` does not load FastAPI, the MCP server and the database drivers.
+_LAZY_EXPORTS = {
+    "AppSetupHook": "papi.core.apps",
+    "MPCRouter": "papi.core.router",
+    "RESTRouter": "papi.core.router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
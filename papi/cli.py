@@ -10,36 +10,29 @@ and FastAPI application lifecycle handling.
 Author: Eduardo M. Fírvida Donestevez
 """
 
+from __future__ import annotations
+
 import asyncio
 import importlib
 import importlib.metadata
+import importlib.util
 import os
+import re
 import sys
 from contextlib import asynccontextmanager
-from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
 from textwrap import dedent
-from typing import Any, AsyncGenerator, Dict, Set
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Set
 
-import anyio
 import click
-import nest_asyncio
-import uvicorn
 
 try:
-    import granian
+    import uvloop
 except ImportError:
-    granian = None
+    uvloop = None
 from click_default_group import DefaultGroup
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
-from IPython.terminal.embed import InteractiveShellEmbed
-from starlette.exceptions import HTTPException
-
-from papi.core.apps import get_router_from_app, has_static_files
-from papi.core.db import get_redis_client
-from papi.core.exceptions import APIException
-from papi.core.init import init_base_system, init_mcp_server, shutdown_apps
+
 from papi.core.logger import disable_logging, logger, setup_logging
 from papi.core.models.config import (
     FastAPIAppConfig,
@@ -48,10 +41,44 @@ from papi.core.models.config import (
     ServerType,
     UvicornServerConfig,
 )
-from papi.core.response import create_response
 from papi.core.settings import get_config
 
-__version__ = importlib.metadata.version("papi")
+# FastAPI, the MCP server and the database drivers are imported by the commands
+# that need them, so `papi --help` and argument errors stay fast.
+if TYPE_CHECKING:
+    from fastapi import FastAPI, Request
+    from fastapi.responses import ORJSONResponse
+    from fastapi.staticfiles import StaticFiles
+    from mcp.server.fastmcp.tools import Tool
+    from starlette.exceptions import HTTPException
+
+    from papi.core.exceptions import APIException
+
+_BANNER_TEMPLATE = dedent(r"""
+               _     ____   ___          ____  _            _  _ 
+     ___      / \   |  _ \ |_ _|        / ___|| |__    ___ | || |
+    |  _ \   / _ \  | |_) | | | _______ \___ \|  _ \  / _ \| || |
+    | |_) | / ___ \ |  __/  | | |_____| ___) || | | ||  __/| || |
+    |  __/ /_/   \_\|_|    |___|       |____/ |_| |_| \___||_||_|
+    |_|                                      Version: {VERSION}
+    """)
+
+_cli_initialized = False
+# `ctx.meta` key of the arguments left for the subcommand, see `_CLIGroup`
+_SUBCOMMAND_ARGS = "papi.subcommand_args"
+
+# `webserver --profile`: set for the server process, whose app may be built by
+# Granian in a child process, and where the per-request reports are written
+_PROFILE_ENV_VAR = "PAPI_PROFILE"
+_PROFILES_DIR = "profiles"
+# Report file names embed the request path: keep them portable and short
+_UNSAFE_REPORT_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+_MAX_REPORT_PATH_LENGTH = 100
+
+# Event loop for the CLI entry points: uvloop where available (not on Windows)
+_new_event_loop = (
+    uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+)
 
 
 def create_fastapi_app_for_granian():
@@ -63,9 +90,24 @@ def create_fastapi_app_for_granian():
     """
     app = create_fastapi_app()
     setup_api_exception_handler(app)
+    if os.environ.get(_PROFILE_ENV_VAR):
+        setup_request_profiling(app)
     return app
 
 
+@lru_cache(maxsize=1)
+def _get_version() -> str:
+    """Return the installed pAPI version, read from the package metadata once."""
+    return importlib.metadata.version("papi")
+
+
+def __getattr__(name: str) -> Any:
+    # `__version__` is resolved on first access rather than at import time.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_banner() -> str:
     """
     Temporarily disable all logging within a context.
@@ -73,15 +115,9 @@ def get_banner() -> str:
     Useful for suppressing noisy output during initialization
     or interactive shell startup.
     """
-    version_str = f"v{__version__}" if not __version__.startswith("v") else __version__
-    return dedent(rf"""
-               _     ____   ___          ____  _            _  _ 
-     ___      / \   |  _ \ |_ _|        / ___|| |__    ___ | || |
-    |  _ \   / _ \  | |_) | | | _______ \___ \|  _ \  / _ \| || |
-    | |_) | / ___ \ |  __/  | | |_____| ___) || | | ||  __/| || |
-    |  __/ /_/   \_\|_|    |___|       |____/ |_| |_| \___||_||_|
-    |_|                                      Version: {version_str}
-    """)
+    version = _get_version()
+    version_str = f"v{version}" if not version.startswith("v") else version
+    return _BANNER_TEMPLATE.replace("{VERSION}", version_str)
 
 
 def get_mcp_server(as_sse: bool = False) -> Any:
@@ -100,22 +136,41 @@ def get_mcp_server(as_sse: bool = False) -> Any:
     Exits:
         Terminates the process with error code 1 on failure.
     """
+    from papi.core.init import init_base_system, init_mcp_server
 
     async def _init() -> Any:
-        modules_extra = await init_base_system()
-        return init_mcp_server(modules_extra, as_sse)
+        base_system = await init_base_system() or {}
+        return init_mcp_server(base_system.get("modules", {}), as_sse)
 
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(_init())
-        loop.close()
-        return result
+        # The loop is closed on exit, also when initialization fails
+        with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+            return runner.run(_init())
     except Exception:
         logger.critical("Error initializing MCP Server", exc_info=True)
         sys.exit(1)
 
 
+@lru_cache(maxsize=None)
+def _static_files(directory: str, immutable: bool = False) -> StaticFiles:
+    """
+    Return a shared StaticFiles app for `directory`.
+
+    Apps and storages pointing at the same directory, and lifespans run again in
+    the same process, reuse one instance instead of checking the directory anew.
+    Directories whose content is `immutable` while the server runs (app assets)
+    are served with cached path lookups; callers check they exist beforehand.
+    """
+    if immutable:
+        from papi.core.staticfiles import CachedStaticFiles
+
+        return CachedStaticFiles(directory=directory, check_dir=False)
+
+    from fastapi.staticfiles import StaticFiles
+
+    return StaticFiles(directory=directory)
+
+
 @asynccontextmanager
 async def run_api_server(app: FastAPI) -> AsyncGenerator:
     """
@@ -127,7 +182,8 @@ async def run_api_server(app: FastAPI) -> AsyncGenerator:
     3. Registers app routes and static assets
     4. Mounts the MCP server endpoint
     5. Configures global storage directories
-    6. Ensures proper resource cleanup on shutdown
+    6. Builds and caches the OpenAPI schema for the registered routes
+    7. Ensures proper resource cleanup on shutdown
 
     Args:
         app: FastAPI application instance to configure
@@ -138,6 +194,15 @@ async def run_api_server(app: FastAPI) -> AsyncGenerator:
     Raises:
         RuntimeError: For critical initialization failures
     """
+    from papi.core.apps import get_router_from_app, get_static_dir
+    from papi.core.db import get_redis_client
+    from papi.core.init import (
+        collect_mcp_tools,
+        init_base_system,
+        init_mcp_server,
+        shutdown_apps,
+    )
+
     redis_client = None
     try:
         # Phase 1: System initialization
@@ -149,63 +214,85 @@ async def run_api_server(app: FastAPI) -> AsyncGenerator:
         redis_client = await get_redis_client()
 
         # Phase 3: App registration
-        loaded_routers: Set[Any] = set()
+        loaded_router_ids: Set[int] = set()
+        mcp_tools: Dict[str, Tool] = {}
         modules = base_system.get("modules", {}) if base_system else {}
 
         for app_id, module in modules.items():
-            # Register app routes
+            # Register app routes, collecting their MCP tools on the way
             if routers := get_router_from_app(module):
                 for router in routers:
-                    if router not in loaded_routers:
+                    # Dedupe by identity: routers are not required to be hashable
+                    router_id = id(router)
+                    if router_id not in loaded_router_ids:
                         app.include_router(router)
-                        loaded_routers.add(router)
-                logger.info(f"App '{app_id}': Registered {len(routers)} routes")
+                        loaded_router_ids.add(router_id)
+                        collect_mcp_tools((router,), mcp_tools)
+                logger.info("App '{}': Registered {} routes", app_id, len(routers))
 
             # Mount static assets
-            if has_static_files(module):
-                static_path = Path(module.__path__[0]) / "static"
-                if static_path.is_dir():
-                    app.mount(
-                        f"/{app_id}",
-                        StaticFiles(directory=static_path),
-                        name=f"{app_id}_static",
-                    )
-                    logger.debug(
-                        f"App '{app_id}': Mounted static assets at {static_path}"
-                    )
-                else:
-                    logger.warning(
-                        f"App '{app_id}': Missing static directory {static_path}"
-                    )
+            # Resolved (and checked to be a directory) when the app was scanned
+            if static_path := get_static_dir(module):
+                app.mount(
+                    f"/{app_id}",
+                    _static_files(str(static_path), immutable=True),
+                    name=f"{app_id}_static",
+                )
+                logger.debug(
+                    "App '{}': Mounted static assets at {}", app_id, static_path
+                )
 
         # Phase 4: MCP server setup
         if modules:
-            mcp_server = init_mcp_server(modules, as_sse=True)
+            mcp_server = init_mcp_server(modules, as_sse=True, tools=mcp_tools)
             app.mount("/mcp", mcp_server, name="MCP Tools")
             logger.info("Mounted MCP server at /mcp")
 
         # Phase 5: Storage configuration
         config = get_config()
         if config.storage:
-            for name, path in config.storage.model_dump().items():
-                os.makedirs(path, exist_ok=True)
+            storages = config.storage.model_dump()
+
+            # Check each distinct directory once, with a single stat() when it is
+            # already there; storages sharing a directory share its StaticFiles.
+            for path in {os.path.realpath(path) for path in storages.values()}:
+                if not os.path.isdir(path):
+                    os.makedirs(path, exist_ok=True)
+
+            for name, path in storages.items():
                 app.mount(
                     f"/storage/{name}",
-                    StaticFiles(directory=path),
+                    _static_files(os.path.realpath(path)),
                     name=f"{name}_storage",
                 )
-                logger.info(f"Storage '{name}' mounted at: /storage/{name}")
+            logger.info(
+                "Storages mounted: {}",
+                ", ".join(f"/storage/{name}" for name in storages),
+            )
+
+        # Phase 6: OpenAPI schema
+        # FastAPI memoizes the schema on first use and never invalidates it, so
+        # drop anything generated before the routes above were registered and
+        # build it once now: `/openapi.json` and `/docs` are then served from
+        # memory from the very first request.
+        if app.openapi_url:
+            app.openapi_schema = None
+            try:
+                app.openapi()
+                logger.debug("OpenAPI schema generated and cached")
+            except Exception as e:
+                logger.warning("Could not pre-generate the OpenAPI schema: {}", e)
 
         # Application ready
         logger.info("Application initialization completed successfully")
         yield
 
     except Exception as e:
-        logger.critical(f"Application initialization failed: {str(e)}")
+        logger.critical("Application initialization failed: {}", e)
         raise RuntimeError("Critical startup failure") from e
 
     finally:
-        # Phase 6: Resource cleanup
+        # Phase 7: Resource cleanup
         logger.info("Starting application shutdown...")
 
         if modules:
@@ -234,6 +321,9 @@ def create_fastapi_app() -> FastAPI:
     Raises:
         RuntimeError: If critical configuration is missing
     """
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
+
     try:
         logger.info("Creating FastAPI application instance")
         config = get_config()
@@ -245,8 +335,13 @@ def create_fastapi_app() -> FastAPI:
 
         info_fields = config.info.defined_fields()
 
-        # Create application with metadata
-        app = FastAPI(**info_fields, lifespan=run_api_server)
+        # Create application with metadata; routes not declared through
+        # RESTRouter also render JSON with orjson
+        app = FastAPI(
+            **info_fields,
+            default_response_class=ORJSONResponse,
+            lifespan=run_api_server,
+        )
 
         logger.debug("FastAPI instance created successfully")
         return app
@@ -273,11 +368,16 @@ def setup_api_exception_handler(app: FastAPI) -> None:
     Note:
         Must be called after app creation but before starting the server
     """
+    from fastapi.responses import ORJSONResponse
+    from starlette.exceptions import HTTPException
+
+    from papi.core.exceptions import APIException
+    from papi.core.response import create_error_payload
 
     @app.exception_handler(APIException)
     async def api_exception_handler(
         request: Request, exc: APIException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         Handles APIException errors and returns structured responses.
 
@@ -286,17 +386,16 @@ def setup_api_exception_handler(app: FastAPI) -> None:
             exc: Raised APIException instance
 
         Returns:
-            JSONResponse: Formatted error response
+            ORJSONResponse: Formatted error response
         """
         # Log the error with appropriate severity
         if exc.status_code >= 500:
-            logger.error(f"Server error ({exc.code}): {exc.message}")
+            logger.error("Server error ({}): {}", exc.code, exc.message)
         elif exc.status_code >= 400:
-            logger.warning(f"Client error ({exc.code}): {exc.message}")
+            logger.warning("Client error ({}): {}", exc.code, exc.message)
 
         # Create standardized error response
-        error_response = create_response(
-            success=False,
+        error_response = create_error_payload(
             message=exc.message,
             error={
                 "code": exc.code,
@@ -307,16 +406,16 @@ def setup_api_exception_handler(app: FastAPI) -> None:
         )
 
         # Return JSON response with appropriate status
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=error_response.model_dump(),
+            content=error_response,
             headers=exc.headers or {},
         )
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(
         request: Request, exc: HTTPException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         Handles HTTP exceptions (404, 405, etc.) with custom pAPI responses.
 
@@ -325,7 +424,7 @@ def setup_api_exception_handler(app: FastAPI) -> None:
             exc: Raised HTTPException instance
 
         Returns:
-            JSONResponse: Formatted error response
+            ORJSONResponse: Formatted error response
         """
         # Create user-friendly messages for common HTTP errors
         status_messages = {
@@ -341,16 +440,21 @@ def setup_api_exception_handler(app: FastAPI) -> None:
         # Log the error appropriately
         if exc.status_code >= 500:
             logger.error(
-                f"HTTP {exc.status_code}: {user_message} - Path: {request.url.path}"
+                "HTTP {}: {} - Path: {}",
+                exc.status_code,
+                user_message,
+                request.url.path,
             )
         elif exc.status_code >= 400:
             logger.warning(
-                f"HTTP {exc.status_code}: {user_message} - Path: {request.url.path}"
+                "HTTP {}: {} - Path: {}",
+                exc.status_code,
+                user_message,
+                request.url.path,
             )
 
         # Create standardized error response using pAPI format
-        error_response = create_response(
-            success=False,
+        error_response = create_error_payload(
             message=user_message,
             error={
                 "code": f"HTTP_{exc.status_code}",
@@ -361,17 +465,100 @@ def setup_api_exception_handler(app: FastAPI) -> None:
             },
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=error_response.model_dump(),
+            content=error_response,
             headers=getattr(exc, "headers", None) or {},
         )
 
     logger.debug("Registered global API exception handlers")
 
 
+def setup_request_profiling(app: FastAPI) -> None:
+    """
+    Profiles every request with pyinstrument and writes one HTML report per request.
+
+    Development aid enabled by `papi webserver --profile`; without the flag the
+    middleware is never installed, so requests pay nothing for it.
+
+    Args:
+        app: FastAPI application instance to profile
+
+    Exits:
+        Terminates the process with error code 1 if pyinstrument is not installed.
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.critical(
+            "pyinstrument is not installed. Install it with: pip install pyinstrument"
+        )
+        sys.exit(1)
+
+    os.makedirs(_PROFILES_DIR, exist_ok=True)
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            return await call_next(request)
+        finally:
+            profiler.stop()
+            report_path = _UNSAFE_REPORT_NAME_CHARS.sub("_", request.url.path)
+            report_name = "{}-{}{}.html".format(
+                datetime.now().strftime("%Y%m%d-%H%M%S-%f"),
+                _UNSAFE_REPORT_NAME_CHARS.sub("_", request.method),
+                report_path[:_MAX_REPORT_PATH_LENGTH],
+            )
+            # A failed report must not replace the response being returned
+            try:
+                with open(
+                    os.path.join(_PROFILES_DIR, report_name), "w", encoding="utf-8"
+                ) as report:
+                    report.write(profiler.output_html())
+            except OSError as e:
+                logger.error("Could not write profiling report {}: {}", report_name, e)
+
+    logger.warning(
+        "Request profiling enabled: reports are written to {}",
+        os.path.abspath(_PROFILES_DIR),
+    )
+
+
+class _CLIGroup(DefaultGroup):
+    """
+    `DefaultGroup` that keeps the arguments parsed for the subcommand.
+
+    Click clears them from the context before the group callback runs, so they
+    are stored in `ctx.meta` for `_help_requested`.
+    """
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        rest = super().parse_args(ctx, args)
+        ctx.meta[_SUBCOMMAND_ARGS] = list(rest)
+        return rest
+
+
+def _help_requested(ctx: click.Context) -> bool:
+    """
+    Whether the invoked subcommand is asked for its help page.
+
+    Click runs the group callback before a subcommand handles its `--help`, so
+    the arguments Click parsed for the subcommand are checked up front.
+    """
+    if ctx.invoked_subcommand is None:
+        return False
+    for arg in ctx.meta.get(_SUBCOMMAND_ARGS, ()):
+        if arg == "--":
+            break
+        if arg in ctx.help_option_names:
+            return True
+    return False
+
+
 @click.group(
-    cls=DefaultGroup,
+    cls=_CLIGroup,
     default="webserver",
     default_if_no_args=True,
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -383,23 +570,33 @@ def setup_api_exception_handler(app: FastAPI) -> None:
     show_default=True,
     help="Path to configuration file. Default is '${PWD}/config.yaml'.",
 )
+@click.version_option(package_name="papi", prog_name="pAPI")
 @click.pass_context
 def cli(ctx, config):
+    global _cli_initialized
+
     if ctx.obj is None:
         ctx.obj = {}
 
-    if not ctx.obj.get("_initialized", False):
-        try:
-            cfg = get_config(config)
-            ctx.obj["config"] = cfg
+    # Subcommand help pages (and shell completion) need no configuration
+    if ctx.resilient_parsing or _help_requested(ctx):
+        return
 
+    try:
+        # Loaded on every invocation, so each one gets its own `--config`;
+        # `get_config` only re-reads a file that is new or has changed.
+        ctx.obj["config"] = get_config(config)
+
+        # Logging is process-wide: set it up only once, even when the CLI is
+        # invoked repeatedly from the same interpreter.
+        if not _cli_initialized:
             setup_logging()
-            ctx.obj["_initialized"] = True
+            _cli_initialized = True
             logger.debug("CLI initialized successfully.")
 
-        except Exception as e:
-            logger.critical("Failed to initialize configuration or logging", exc_info=e)
-            sys.exit(1)
+    except Exception as e:
+        logger.critical("Failed to initialize configuration or logging", exc_info=e)
+        sys.exit(1)
 
 
 @cli.command(name="shell")
@@ -417,34 +614,38 @@ def shell() -> None:
     Usage:
     $ papi shell
     """
-    nest_asyncio.apply()  # Enable nested event loops
+    # IPython is only needed here and is slow to import
+    from IPython.terminal.embed import InteractiveShellEmbed
+
+    from papi.core.init import init_base_system
 
-    async def start_shell() -> None:
-        """Initialize system and launch IPython shell."""
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
         try:
             with disable_logging():  # Suppress initialization logs
-                base_system = await init_base_system() or {}
+                base_system = runner.run(init_base_system()) or {}
 
-                # Prepare shell environment
-                namespace: Dict[str, Any] = (
-                    {k: v for k, v in base_system.items() if v} if base_system else {}
-                )
+            # Prepare shell environment
+            namespace: Dict[str, Any] = (
+                {k: v for k, v in base_system.items() if v} if base_system else {}
+            )
 
-                # Configure IPython shell
-                shell = InteractiveShellEmbed(
-                    banner1=get_banner(),
-                    user_ns=namespace,
-                    exit_msg="Exiting pAPI shell. Goodbye!",
-                )
-                shell.run_line_magic("autoawait", "asyncio")
-                shell()
+            # Configure IPython shell
+            shell = InteractiveShellEmbed(
+                banner1=get_banner(),
+                user_ns=namespace,
+                exit_msg="Exiting pAPI shell. Goodbye!",
+            )
+            # Top-level `await` runs on the loop the system was initialized
+            # on (database clients are bound to it), from outside any running
+            # loop, so no nested event loops are needed.
+            shell.autoawait = True
+            shell.loop_runner = runner.run
+            shell()
 
         except Exception as e:
-            logger.critical(f"Failed to start interactive shell: {e}", exc_info=True)
+            logger.critical("Failed to start interactive shell: {}", e, exc_info=True)
             sys.exit(1)
 
-    anyio.run(start_shell)
-
 
 @cli.command(name="webserver")
 @click.option(
@@ -452,7 +653,12 @@ def shell() -> None:
     type=click.Choice(["granian", "uvicorn"]),
     help="Server type to use (overrides config)",
 )
-def webserver(server: str | None = None) -> None:
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile each request with pyinstrument, writing HTML reports to ./profiles",
+)
+def webserver(server: str | None = None, profile: bool = False) -> None:
     """
     Start the production FastAPI web server.
 
@@ -467,12 +673,18 @@ def webserver(server: str | None = None) -> None:
     $ papi webserver                    # Uses Granian by default
     $ papi webserver --server granian   # Explicitly use Granian
     $ papi webserver --server uvicorn   # Use Uvicorn instead
+    $ papi webserver --profile          # Write a pyinstrument report per request
     """
     try:
         logger.info("Creating FastAPI application")
         app = create_fastapi_app()
         setup_api_exception_handler(app)
 
+        if profile:
+            # Read where the served app is set up: in this process for Uvicorn,
+            # in the Granian process (which inherits it) otherwise
+            os.environ[_PROFILE_ENV_VAR] = "1"
+
         config = get_config()
 
         if not config.server:
@@ -489,7 +701,7 @@ def webserver(server: str | None = None) -> None:
         server_config = config.server.get_server_config()
 
         if config.server.type == ServerType.GRANIAN:
-            if granian is None:
+            if importlib.util.find_spec("granian") is None:
                 logger.error(
                     "Granian is not installed. Install it with: pip install granian"
                 )
@@ -514,7 +726,7 @@ def webserver(server: str | None = None) -> None:
                 sys.exit(1)
 
     except Exception as e:
-        logger.critical(f"Webserver startup failed: {e}", exc_info=True)
+        logger.critical("Webserver startup failed: {}", e, exc_info=True)
         sys.exit(1)
 
 
@@ -528,7 +740,10 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
     try:
         # Use Granian CLI directly to avoid ASGI/RSGI interface issues
         logger.info(
-            f"Starting Granian server on {config.host}:{config.port} with {config.workers} workers"
+            "Starting Granian server on {}:{} with {} workers",
+            config.host,
+            config.port,
+            config.workers,
         )
 
         # Build granian command with proper interface
@@ -555,7 +770,7 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
         if getattr(config, "access_log", False):
             cmd.extend(["--access-log"])
 
-        logger.debug(f"Granian command: {' '.join(cmd)}")
+        logger.debug("Granian command: {}", " ".join(cmd))
 
         # Start the granian process with new process group
         process = subprocess.Popen(cmd, preexec_fn=os.setsid)
@@ -568,12 +783,12 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
             nonlocal shutdown_initiated
             if shutdown_initiated:
                 logger.debug(
-                    f"Signal {signum} received but shutdown already in progress"
+                    "Signal {} received but shutdown already in progress", signum
                 )
                 return
 
             shutdown_initiated = True
-            logger.info(f"Received signal {signum}, shutting down Granian server...")
+            logger.info("Received signal {}, shutting down Granian server...", signum)
 
             try:
                 # Send SIGTERM to the entire process group to ensure all workers are terminated
@@ -604,7 +819,7 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
                 # Process was already terminated or doesn't exist - this is normal
                 logger.debug("Process already terminated or cleaned up")
             except Exception as e:
-                logger.warning(f"Unexpected error during shutdown: {e}")
+                logger.warning("Unexpected error during shutdown: {}", e)
 
             sys.exit(0)
 
@@ -616,7 +831,7 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
         try:
             return_code = process.wait()
             if return_code != 0:
-                logger.error(f"Granian process exited with code {return_code}")
+                logger.error("Granian process exited with code {}", return_code)
                 sys.exit(return_code)
         except KeyboardInterrupt:
             # This should be handled by the signal handler, but just in case
@@ -628,23 +843,36 @@ def _run_granian_server(app: FastAPI, config: GranianServerConfig) -> None:
         logger.critical("Granian is not installed. Install with: pip install granian")
         raise
     except subprocess.CalledProcessError as e:
-        logger.critical(f"Granian process failed with exit code {e.returncode}")
+        logger.critical("Granian process failed with exit code {}", e.returncode)
         raise
     except Exception as e:
-        logger.critical(f"Granian server error: {e}", exc_info=True)
+        logger.critical("Granian server error: {}", e, exc_info=True)
         raise
 
 
 def _run_uvicorn_server(app: FastAPI, config: UvicornServerConfig) -> None:
     """Run the application using Uvicorn server."""
+    import uvicorn
+
+    if os.environ.get(_PROFILE_ENV_VAR):
+        setup_request_profiling(app)
+
     try:
+        server_options = config.defined_fields()
+        # Run on uvloop and the httptools parser unless configured otherwise,
+        # falling back to the stdlib loop and h11 where they are unavailable
+        # (uvloop does not support Windows).
+        server_options.setdefault("loop", "uvloop" if uvloop is not None else "asyncio")
+        server_options.setdefault(
+            "http", "httptools" if importlib.util.find_spec("httptools") else "h11"
+        )
         uvicorn_config = uvicorn.Config(
-            app, log_config=None, access_log=False, **config.defined_fields()
+            app, log_config=None, access_log=False, **server_options
         )
         server = uvicorn.Server(uvicorn_config)
         server.run()
     except Exception as e:
-        logger.critical(f"Uvicorn server error: {e}", exc_info=True)
+        logger.critical("Uvicorn server error: {}", e, exc_info=True)
         raise
 
 
@@ -664,7 +892,7 @@ def mcpserver() -> None:
         logger.info("Starting MCP server in standalone mode")
         mcp.run()
     except Exception as e:
-        logger.critical(f"MCP Server error: {e}", exc_info=True)
+        logger.critical("MCP Server error: {}", e, exc_info=True)
         sys.exit(1)
 
 
@@ -672,5 +900,5 @@ if __name__ == "__main__":
     try:
         cli(prog_name="papi")
     except Exception as e:
-        logger.critical(f"CLI runtime error: {e}", exc_info=True)
+        logger.critical("CLI runtime error: {}", e, exc_info=True)
         sys.exit(1)
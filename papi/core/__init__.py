@@ -1 +1,22 @@
-from .router import MPCRouter, RESTRouter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .router import MPCRouter, RESTRouter
+
+__all__ = ["MPCRouter", "RESTRouter"]
+
+# Imported on first access; see `papi.__init__`.
+_LAZY_EXPORTS = {
+    "MPCRouter": ".router",
+    "RESTRouter": ".router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
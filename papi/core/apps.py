@@ -5,12 +5,14 @@ model discovery, and router registration for FastAPI and custom protocols.
 
 import importlib
 import os
+import stat
 import sys
+from functools import lru_cache
 from graphlib import CycleError, TopologicalSorter
 from inspect import isclass, ismodule
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Type
 
 from beanie import Document
 from fastapi import APIRouter as FASTApiRouter
@@ -259,36 +261,52 @@ def load_and_import_all_apps(graph: AppsGraph) -> Dict[str, ModuleType]:
     return modules
 
 
-def get_beanie_documents_from_app(module: ModuleType) -> List[Type[Document]]:
+class _AppIntrospection(NamedTuple):
     """
-    Recursively search an app module and return all Beanie document classes.
+    Objects discovered in an app module (and its submodules) by a single scan.
     """
-    models: Set[Type[Document]] = set()
-    processed: Set[ModuleType] = set()
 
-    def _search(current: ModuleType) -> None:
-        if current in processed:
-            return
-        processed.add(current)
+    routers: List[RESTRouter | MPCRouter | FASTApiRouter]
+    documents: Set[Type[Document]]
+    sqlalchemy_models: Set[Type[DeclarativeMeta]]
+    setup_hooks: Set[Type[AppSetupHook]]
+    static_dir: Optional[Path]
 
-        for attr_name in dir(current):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(current, attr_name)
-            if _is_document_subclass(attr):
-                models.add(attr)
-            elif _is_submodule(attr, module):
-                _search(attr)
 
-    _search(module)
-    return list(models)
+def _resolve_static_dir(module: ModuleType) -> Optional[Path]:
+    """
+    Return the app package's 'static' directory, checked with a single stat().
+    """
+    package_path = getattr(module, "__path__", None)
+    if not package_path:
+        return None
+
+    static_dir = Path(package_path[0]) / "static"
+    try:
+        mode = os.stat(static_dir).st_mode
+    except OSError:
+        return None
+    if not stat.S_ISDIR(mode):
+        logger.warning(f"App '{module.__name__}': {static_dir} is not a directory")
+        return None
+    return static_dir
 
 
-def get_sqlalchemy_models_from_app(module: ModuleType) -> List[Type[DeclarativeMeta]]:
+@lru_cache(maxsize=None)
+def _introspect_app(module: ModuleType) -> _AppIntrospection:
     """
-    Recursively search an app module and return all SQLAlchemy declarative model classes.
+    Recursively scan an app module once and collect everything pAPI looks for.
+
+    The result is memoized per module, so the lifespan, the MCP server and the
+    database initialization share a single walk over each app's namespace.
     """
-    models: Set[Type[DeclarativeMeta]] = set()
+    introspection = _AppIntrospection(
+        routers=[],
+        documents=set(),
+        sqlalchemy_models=set(),
+        setup_hooks=set(),
+        static_dir=_resolve_static_dir(module),
+    )
     processed: Set[ModuleType] = set()
 
     def _search(current: ModuleType) -> None:
@@ -300,35 +318,38 @@ def get_sqlalchemy_models_from_app(module: ModuleType) -> List[Type[DeclarativeM
             if attr_name.startswith("_"):
                 continue
             attr = getattr(current, attr_name)
-            if _is_sqlalchemy_model(attr):
-                models.add(attr)
+            if isinstance(attr, (RESTRouter, MPCRouter, FASTApiRouter)):
+                introspection.routers.append(attr)
             elif _is_submodule(attr, module):
                 _search(attr)
+                continue
+            if _is_document_subclass(attr):
+                introspection.documents.add(attr)
+            if _is_sqlalchemy_model(attr):
+                introspection.sqlalchemy_models.add(attr)
+            if _implements_app_setup_hook(attr):
+                introspection.setup_hooks.add(attr)
 
     _search(module)
-    return list(models)
+    return introspection
 
 
-def get_app_setup_hooks(module: ModuleType) -> List[Type[AppSetupHook]]:
-    hooks: Set[Type[AppSetupHook]] = set()
-    processed: Set[ModuleType] = set()
+def get_beanie_documents_from_app(module: ModuleType) -> List[Type[Document]]:
+    """
+    Recursively search an app module and return all Beanie document classes.
+    """
+    return list(_introspect_app(module).documents)
 
-    def _search(current: ModuleType) -> None:
-        if current in processed:
-            return
-        processed.add(current)
 
-        for attr_name in dir(current):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(current, attr_name)
-            if _implements_app_setup_hook(attr):
-                hooks.add(attr)
-            elif _is_submodule(attr, module):
-                _search(attr)
+def get_sqlalchemy_models_from_app(module: ModuleType) -> List[Type[DeclarativeMeta]]:
+    """
+    Recursively search an app module and return all SQLAlchemy declarative model classes.
+    """
+    return list(_introspect_app(module).sqlalchemy_models)
 
-    _search(module)
-    return list(hooks)
+
+def get_app_setup_hooks(module: ModuleType) -> List[Type[AppSetupHook]]:
+    return list(_introspect_app(module).setup_hooks)
 
 
 def get_router_from_app(
@@ -338,32 +359,21 @@ def get_router_from_app(
     Recursively search an app module and return all router instances
     (REST, MPC, or FastAPI).
     """
-    routers = []
-    processed = set()
-
-    def _search(current: ModuleType) -> None:
-        if current in processed:
-            return
-        processed.add(current)
-
-        for attr_name in dir(current):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(current, attr_name)
-            if isinstance(attr, (RESTRouter, MPCRouter, FASTApiRouter)):
-                routers.append(attr)
-            elif _is_submodule(attr, module):
-                _search(attr)
-
-    _search(module)
-    return routers
+    return list(_introspect_app(module).routers)
 
 
 def has_static_files(module: ModuleType) -> bool:
     """
     Check if the app module contains a 'static' directory.
     """
-    return (Path(module.__path__[0]) / "static").exists()
+    return _introspect_app(module).static_dir is not None
+
+
+def get_static_dir(module: ModuleType) -> Optional[Path]:
+    """
+    Return the path of the app module's 'static' directory, if it has one.
+    """
+    return _introspect_app(module).static_dir
 
 
 def _is_document_subclass(obj: Any) -> bool:
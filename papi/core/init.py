@@ -1,8 +1,11 @@
+import asyncio
+from functools import lru_cache
 from types import ModuleType
-from typing import Callable, Optional, Type
+from typing import Any, Callable, Coroutine, Iterable, Optional, Type
 
 from beanie import init_beanie
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import PyMongoError, ServerSelectionTimeoutError
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,6 +15,7 @@ from starlette.applications import Starlette
 
 from papi.core.apps import (
     AppSetupHook,
+    AppsGraph,
     get_app_setup_hooks,
     get_apps_from_dir,
     get_beanie_documents_from_app,
@@ -211,6 +215,39 @@ async def init_sqlalchemy(
         raise RuntimeError(f"SQLAlchemy initialization error: {exc!r}")
 
 
+@lru_cache(maxsize=1)
+def load_apps(
+    apps_path: str, enabled_apps_ids: tuple[str, ...]
+) -> tuple[AppsGraph, dict[str, ModuleType]]:
+    """
+    Discover the enabled apps, install their Python dependencies and import them.
+
+    The result is memoized for the given apps directory and enabled app IDs, so
+    the web server lifespan, the MCP server and the shell share a single walk of
+    the apps directory and a single import pass when they run in the same
+    process.
+
+    Args:
+        apps_path (str): Path to the directory containing the apps.
+        enabled_apps_ids (tuple[str, ...]): IDs of the apps to enable.
+
+    Returns:
+        tuple:
+            - The graph of enabled apps and their dependencies.
+            - A dictionary mapping app IDs to imported modules.
+    """
+    apps_graph = get_apps_from_dir(
+        apps_path=apps_path,
+        enabled_apps_ids=list(enabled_apps_ids),
+    )
+
+    python_deps = apps_graph.get_all_python_dependencies()
+    if python_deps:
+        install_python_dependencies(python_deps)
+
+    return apps_graph, load_and_import_all_apps(apps_graph)
+
+
 async def init_base_system(init_db_system: bool = True) -> dict | None:
     """
     Initialize the base system by loading apps and initializing the database.
@@ -231,19 +268,10 @@ async def init_base_system(init_db_system: bool = True) -> dict | None:
 
     try:
         # Discover and import apps
-        apps_graph = get_apps_from_dir(
-            apps_path=apps_path,
-            enabled_apps_ids=config.apps.enabled,
-        )
+        apps_graph, modules = load_apps(apps_path, config.apps.enabled)
         if not apps_graph:
             return
 
-        python_deps = apps_graph.get_all_python_dependencies()
-        if python_deps:
-            install_python_dependencies(python_deps)
-
-        modules = load_and_import_all_apps(apps_graph)
-
     except (ValueError, ImportError) as e:
         logger.exception(f"Failed to load apps: {e}")
         raise RuntimeError("App loading failed") from e
@@ -257,25 +285,38 @@ async def init_base_system(init_db_system: bool = True) -> dict | None:
         app = apps_graph.apps[app_id]
         logger.debug(f"  → {app.name} (v{app.version}) by {app.authors}")
 
+    beanie_document_models = []
+    sql_models = []
+
     if init_db_system and config.database:
+        # The backends are independent of each other, so their connection
+        # handshakes and schema setup run concurrently.
+        db_setups: dict[str, Coroutine[Any, Any, Any]] = {}
+
         # Init MongoDB Documents, and Beanie models on system Startup.
         if config.database.mongodb_uri:
-            beanie_document_models = await init_mongodb_beanie(config, modules)
-        else:
-            beanie_document_models = []
+            db_setups["mongo_documents"] = init_mongodb_beanie(config, modules)
 
         # Init SQL models and create tables on system Startup if tables not exist
         if config.database.sql_uri:
-            sql_models = await init_sqlalchemy(config, modules)
-        else:
-            sql_models = []
+            db_setups["sql_models"] = init_sqlalchemy(config, modules)
 
         # cache Redis client on startup
         if config.database.redis_uri:
-            await get_redis_client()
-    else:
-        beanie_document_models = []
-        sql_models = []
+            db_setups["redis"] = get_redis_client()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    name: tg.create_task(setup) for name, setup in db_setups.items()
+                }
+        except ExceptionGroup as eg:
+            # The other setups were cancelled; surface the failure as raised.
+            raise eg.exceptions[0]
+
+        results = {name: task.result() for name, task in tasks.items()}
+        beanie_document_models = results.get("mongo_documents", [])
+        sql_models = results.get("sql_models", [])
 
     await startup_apps(modules)
 
@@ -286,8 +327,35 @@ async def init_base_system(init_db_system: bool = True) -> dict | None:
     }
 
 
+def collect_mcp_tools(routers: Iterable[Any], tools: dict[str, Tool]) -> None:
+    """
+    Add the MCP tools declared by the given routers to `tools`.
+
+    Tools are routes marked as `MPCRouter` instances or flagged with the
+    `is_mcp_tool` attribute, keyed by tool name; the first tool registered
+    under a name wins.
+
+    Args:
+        routers (Iterable[Any]): Routers whose routes are inspected.
+        tools (dict[str, Tool]): Mapping of tool names to tools, updated in place.
+    """
+    for router in routers:
+        for route in router.routes:
+            # Identify MCP tools either by router type or flag
+            if isinstance(route, MPCRouter) or getattr(route, "is_mcp_tool", False):
+                # RESTRouter routes cache their tool; build it for anything else
+                tool = getattr(route, "mcp_tool", None) or Tool.from_function(
+                    route.endpoint
+                )
+                if tool.name not in tools:
+                    logger.debug(f"  → Adding MCP tool: {tool.name}")
+                    tools[tool.name] = tool
+
+
 def init_mcp_server(
-    modules: dict[str, ModuleType], as_sse: bool = False
+    modules: dict[str, ModuleType],
+    as_sse: bool = False,
+    tools: Optional[dict[str, Tool]] = None,
 ) -> Starlette | FastMCP:
     """
     Initialize the MCP (Model Context Protocol) server and register its tools.
@@ -299,26 +367,19 @@ def init_mcp_server(
     Args:
         modules (dict[str, ModuleType]): A dictionary of loaded app modules.
         as_sse (bool, optional): If True, the server is wrapped as a Starlette SSE app. Defaults to False.
+        tools (Optional[dict[str, Tool]]): Tools already collected with
+            `collect_mcp_tools` (e.g. while registering the routers). When given,
+            the modules are not searched again.
 
     Returns:
         Starlette | FastMCP: The configured FastMCP instance, optionally as a Starlette app for SSE.
     """
-    mcp_server = FastMCP()
     logger.info("Initializing MCP tools...")
+    if tools is None:
+        tools = {}
+        for module in modules.values():
+            logger.debug(f"  → Searching MCP tools in module: {module.__name__}")
+            collect_mcp_tools(get_router_from_app(module), tools)
 
-    for module in modules.values():
-        loaded_tools = []
-        logger.debug(f"  → Searching MCP tools in module: {module.__name__}")
-        routers = get_router_from_app(module)
-
-        for router in routers:
-            for route in router.routes:
-                # Identify MCP tools either by router type or flag
-                if isinstance(route, MPCRouter) or getattr(route, "is_mcp_tool", False):
-                    name = route.endpoint.__name__
-                    if name not in loaded_tools:
-                        logger.debug(f"  → Adding MCP tool: {name}")
-                        mcp_server.add_tool(route.endpoint)
-                        loaded_tools.append(name)
-
+    mcp_server = FastMCP(tools=list(tools.values()))
     return create_sse_server(mcp_server) if as_sse else mcp_server
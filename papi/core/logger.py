@@ -2,7 +2,7 @@ import logging
 import sys
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator, List
 
 from loguru import logger
 from loguru._defaults import LOGURU_FORMAT
@@ -10,6 +10,11 @@ from loguru._defaults import LOGURU_FORMAT
 from papi.core.models.config import LoggerLevel
 from papi.core.settings import get_config
 
+# Loguru handlers added by `setup_logging`: their settings, and the ids they
+# currently have (`disable_logging` removes and re-adds them).
+_handlers: List[Dict[str, Any]] = []
+_handler_ids: List[int] = []
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -93,10 +98,11 @@ def setup_logging() -> None:
                 else "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level} | {extra[logger_name]}:{function}:{line} - {message}"
             ),
         })
-    logger.configure(
+    _handler_ids[:] = logger.configure(
         handlers=handlers,
         extra={"logger_name": "pAPI"},
     )
+    _handlers[:] = handlers
     logger.info("Logging initialized.")
 
 
@@ -107,10 +113,19 @@ def disable_logging() -> Generator[None, None, None]:
 
     Useful for suppressing noisy output during initialization
     or interactive shell startup.
+
+    Both the standard library loggers and the Loguru handlers configured by
+    `setup_logging` are silenced; in both cases the check happens before a
+    record is built, so suppressed calls stay cheap. The Loguru handlers are
+    removed for the duration of the context and added back on exit, leaving
+    any module enabled or disabled in Loguru untouched.
     """
     previous_level = logging.root.manager.disable
     logging.disable(logging.CRITICAL)
+    for handler_id in _handler_ids:
+        logger.remove(handler_id)
     try:
         yield
     finally:
+        _handler_ids[:] = [logger.add(**handler) for handler in _handlers]
         logging.disable(previous_level)
@@ -24,7 +24,7 @@ class AppsConfig(BaseModel):
 
     Attributes:
         apps_dir (str): Filesystem path to apps directory.
-        enabled (List[str]): List of enabled app identifiers.
+        enabled (Tuple[str, ...]): Enabled app identifiers, without duplicates.
         config (Dict[str, Dict[str, Any]]): Custom configuration per app.
 
     Example:
@@ -38,11 +38,23 @@ class AppsConfig(BaseModel):
     """
 
     apps_dir: str = Field(..., description="Path to apps directory")
-    enabled: List[str] = Field(default_factory=list, description="List of enabled apps")
+    enabled: Tuple[str, ...] = Field(
+        default_factory=tuple, description="List of enabled apps"
+    )
     config: Dict[str, Dict[str, Any]] = Field(
         default_factory=dict, description="App-specific configuration dictionary"
     )
 
+    @field_validator("enabled")
+    def dedupe_enabled(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Drop repeated app IDs, keeping the first occurrence.
+
+        The order is kept because it drives the app load order; being a tuple,
+        the value can key the app loading cache as is.
+        """
+        return tuple(dict.fromkeys(v))
+
 
 class FastAPIAppConfig(BaseModel):
     """
@@ -371,6 +383,13 @@ class ServerConfig(BaseModel):
         type (ServerType): Server type to use (granian or uvicorn).
         granian (Optional[GranianServerConfig]): Granian-specific configuration.
         uvicorn (Optional[UvicornServerConfig]): Uvicorn-specific configuration.
+        validate_responses (bool): Validate *path operation* return values
+            against their `response_model`. Routes can still opt out one by one
+            with `validate_response=False`. When turned off, returned instances
+            of the `response_model` class are sent without being validated or
+            filtered again, so they must already hold valid data; every other
+            value is still built into the `response_model`, keeping its
+            filtering.
     """
 
     type: ServerType = Field(
@@ -382,6 +401,13 @@ class ServerConfig(BaseModel):
     uvicorn: Optional[UvicornServerConfig] = Field(
         default=None, description="Uvicorn server configuration"
     )
+    validate_responses: bool = Field(
+        default=True,
+        description=(
+            "Validate route responses against their response_model; when off, "
+            "response_model instances are sent without validation or filtering"
+        ),
+    )
 
     def get_server_config(self) -> Union[GranianServerConfig, UvicornServerConfig]:
         """
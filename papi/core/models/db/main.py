@@ -2,8 +2,6 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, model_validator, root_validator
 
-from papi.core.db.factory import load_backend_config
-
 from .base import BackendSettings
 
 
@@ -110,7 +108,11 @@ class DatabaseConfig(BaseModel):
                 backends.setdefault(backend_name, {})  # create if not exists
                 backends[backend_name].setdefault("url", uri)
 
-        # Instantiate backend config objects
+        # Instantiate backend config objects. Imported here: importing the
+        # `papi.core.db` package at module level loads the database drivers and
+        # makes loading the settings circular.
+        from papi.core.db.factory import load_backend_config
+
         values["backends"] = {
             name: load_backend_config(name, config) for name, config in backends.items()
         }
@@ -59,3 +59,51 @@ def create_response(
             requestId=str(uuid.uuid4()),
         ),
     )
+
+
+def create_error_payload(
+    message: Optional[str] = None,
+    error: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build an error response body in the `APIResponse` format as a plain dict.
+
+    Produces the same structure as ``create_response(success=False, ...).model_dump()``
+    without instantiating and dumping the pydantic models, which keeps exception
+    handlers cheap on error-heavy workloads (authentication failures, rate limits,
+    404s). Use `create_response` when the response must be validated.
+
+    Parameters
+    ----------
+    message : str, optional
+        An optional human-readable message to include in the response.
+    error : dict, optional
+        A dictionary with error details, with the same keys accepted by
+        `create_response`.
+
+    Returns
+    -------
+    dict
+        The serializable response body.
+    """
+    error_obj: Optional[Dict[str, Any]] = None
+
+    if error:
+        error_obj = {
+            "status_code": error.get("status_code", DEFAULT_ERROR_CODE),
+            "detail": error.get("detail"),
+            "message": error.get("message", "Internal server error"),
+            "code": error.get("code", "ERROR"),
+        }
+
+    return {
+        "success": False,
+        "message": message,
+        "data": None,
+        "error": error_obj,
+        "meta": {
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
+            + "Z",
+            "requestId": str(uuid.uuid4()),
+        },
+    }
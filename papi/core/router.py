@@ -1,9 +1,14 @@
 from __future__ import annotations as _annotations
 
+import re
+import sys
 from enum import Enum
+from functools import cached_property, lru_cache, wraps
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
+    Coroutine,
     Dict,
     List,
     Optional,
@@ -13,23 +18,259 @@ from typing import (
     Union,
 )
 
-from fastapi import params
 from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute as FastAPIRoute
 from fastapi.routing import APIRouter as FastAPIRouter
-from fastapi.types import DecoratedCallable, IncEx
-from fastapi.utils import (
-    generate_unique_id,
-)
 from fastmcp import FastMCP
 from loguru import logger
-from starlette.responses import JSONResponse, Response
-from starlette.routing import (
-    BaseRoute,
-)
+from mcp.server.fastmcp.tools import Tool
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from starlette.routing import Mount as Mount
 from starlette.routing import Route as Route
-from typing_extensions import Annotated, Doc
+
+from papi.core.settings import get_loaded_config
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if TYPE_CHECKING:
+    # Only referenced from annotations. Those are postponed (PEP 563), so the
+    # Annotated[..., Doc(...)] metadata on the signatures below is kept as plain
+    # strings and never evaluated at runtime, with or without `python -O`.
+    from fastapi import params
+    from fastapi.types import DecoratedCallable, IncEx
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import BaseRoute
+    from starlette.types import ASGIApp, Lifespan
+    from typing_extensions import Annotated, Doc, deprecated
+
+# Shared, immutable ``methods`` values handed to every registered route, so
+# declaring a route doesn't allocate a fresh one-element list each time.
+_METHODS = {
+    method: (method,)
+    for method in ("GET", "PUT", "POST", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE")
+}
+_SUCCESSFUL_RESPONSE = sys.intern("Successful Response")
+_NON_WORD_RE = re.compile(r"\W")
+
+
+@lru_cache(maxsize=4096)
+def _unique_id(name: str, path_format: str, method: str) -> str:
+    operation_id = _NON_WORD_RE.sub("_", f"{name}{path_format}")
+    return f"{operation_id}_{method.lower()}"
+
+
+def generate_unique_id(route: FastAPIRoute) -> str:
+    """
+    Memoized equivalent of `fastapi.utils.generate_unique_id`.
+
+    The operation ID only depends on the route name, path format and method, so
+    it is computed once per combination instead of on every OpenAPI generation
+    and every time the route is included into another router.
+    """
+    assert route.methods
+    return _unique_id(route.name, route.path_format, next(iter(route.methods)))
+
+
+# Shared `Default(...)` placeholders for the runtime defaults below, so every
+# registered route carries the same instances instead of one per call site.
+_DEFAULT_NONE = Default(None)
+_DEFAULT_FALSE = Default(False)
+_DEFAULT_TRUE = Default(True)
+_DEFAULT_RESPONSE_CLASS = Default(ORJSONResponse)
+_DEFAULT_UNIQUE_ID = Default(generate_unique_id)
+
+
+def generate_tag_name_unique_id(route: FastAPIRoute) -> str:
+    """
+    Operation ID made of the route's first tag and its name, e.g. `items_read_item`.
+
+    Opt-in alternative to `generate_unique_id` that gives shorter, stable names in
+    generated clients. Route names must be unique per tag for the IDs to be
+    unique. Routes without tags use their name alone.
+
+    Example:
+        router = RESTRouter(generate_unique_id_function=generate_tag_name_unique_id)
+    """
+    if not route.tags:
+        return route.name
+    tag = route.tags[0]
+    return f"{tag.value if isinstance(tag, Enum) else tag}_{route.name}"
+
+
+def _fast_route(method: str) -> Callable[..., None]:
+    """
+    Build a narrow, non-decorator registration method for a single HTTP verb.
+
+    The generated method only accepts the handful of options most endpoints use
+    and hands them straight to `add_api_route`, leaving every other option to
+    FastAPI's own defaults.
+    """
+    methods = _METHODS[method]
+
+    def fast_route(
+        self: RESTRouter,
+        path: str,
+        endpoint: Callable[..., Any],
+        *,
+        response_model: Any = _DEFAULT_NONE,
+        status_code: Optional[int] = None,
+        tags: Optional[List[Union[str, Enum]]] = None,
+        expose_as_mcp_tool: bool = False,
+    ) -> None:
+        self.add_api_route(
+            path,
+            endpoint,
+            methods=methods,
+            response_model=response_model,
+            status_code=status_code,
+            tags=tags,
+            response_class=_DEFAULT_RESPONSE_CLASS,
+            generate_unique_id_function=_DEFAULT_UNIQUE_ID,
+            expose_as_mcp_tool=expose_as_mcp_tool,
+        )
+
+    fast_route.__name__ = fast_route.__qualname__ = f"fast_{method.lower()}"
+    fast_route.__doc__ = (
+        f"Register `endpoint` as an HTTP {method} *path operation* at `path`.\n\n"
+        f"Lightweight alternative to `.{method.lower()}()` for startup-sensitive "
+        "code paths that only need `response_model`, `status_code`, `tags` and "
+        "`expose_as_mcp_tool`."
+    )
+    return fast_route
+
+
+# Defaults shared by every verb decorator. They mirror the defaults declared on
+# the `RESTRouter.get/put/post/delete/patch` signatures; calls with overrides
+# work on a copy, so the dict itself is never modified.
+_ROUTE_TEMPLATE: Dict[str, Any] = {
+    "response_model": _DEFAULT_NONE,
+    "status_code": None,
+    "tags": None,
+    "dependencies": None,
+    "summary": None,
+    "description": None,
+    "response_description": _SUCCESSFUL_RESPONSE,
+    "responses": None,
+    "deprecated": None,
+    "operation_id": None,
+    "response_model_include": None,
+    "response_model_exclude": None,
+    "response_model_by_alias": True,
+    "response_model_exclude_unset": _DEFAULT_FALSE,
+    "response_model_exclude_defaults": False,
+    "response_model_exclude_none": False,
+    "include_in_schema": True,
+    "response_class": _DEFAULT_RESPONSE_CLASS,
+    "name": None,
+    "callbacks": None,
+    "openapi_extra": None,
+    "generate_unique_id_function": _DEFAULT_UNIQUE_ID,
+    "expose_as_mcp_tool": False,
+    "validate_response": _DEFAULT_TRUE,
+}
+
+
+def _route_method(method: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Turn a documented verb declaration into a `RESTRouter` path operation method.
+
+    The decorated function only provides the public signature and documentation.
+    At runtime every verb shares this single implementation, which merges the
+    given options over the shared defaults template and registers the route through
+    `add_api_route`.
+    """
+    methods = _METHODS[method]
+
+    def wrap(declaration: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(declaration)
+        def route_method(
+            self: RESTRouter, path: str, **overrides: Any
+        ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+            # Bare `@router.get(path)` uses the shared template as-is; otherwise
+            # a `dict.copy()` of the fixed-shape template is cheaper than
+            # rebuilding it key by key.
+            if overrides:
+                options = _ROUTE_TEMPLATE.copy()
+                options.update(overrides)
+            else:
+                options = _ROUTE_TEMPLATE
+
+            def decorator(func: DecoratedCallable) -> DecoratedCallable:
+                self.add_api_route(path, func, methods=methods, **options)
+                return func
+
+            return decorator
+
+        return route_method
+
+    return wrap
+
+
+class _UnvalidatedResponseField:
+    """
+    Response field wrapper used by routes registered with `validate_response=False`.
+
+    Values that already are instances of the `response_model` class are passed
+    through without being validated again. Anything else (dicts, ORM objects,
+    lists, optional or union shapes) is built into the `response_model` with a
+    `TypeAdapter`, so undeclared keys never reach the response. Serialization is
+    delegated to the wrapped field so the `response_model_*` options keep
+    working.
+    """
+
+    __slots__ = ("field", "model", "adapter")
+
+    def __init__(self, field: Any) -> None:
+        self.field = field
+        model = field.type_
+        self.model = (
+            model if isinstance(model, type) and issubclass(model, BaseModel) else None
+        )
+        # Built once per route: the field is created when the route handler is.
+        self.adapter = TypeAdapter(model)
+
+    def validate(self, value: Any, values: Any = None, *, loc: Any = ()) -> Any:
+        if self.model is not None and isinstance(value, self.model):
+            return value, None
+        try:
+            return self.adapter.validate_python(value, from_attributes=True), None
+        except ValidationError as e:
+            return None, [
+                {**error, "loc": (*loc, *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+
+    def serialize(self, value: Any, **kwargs: Any) -> Any:
+        return self.field.serialize(value, **kwargs)
+
+
+class _StructResponseField:
+    """
+    Response field used by routes whose `response_model` is a msgspec `Struct`.
+
+    Dicts are converted to the struct with `msgspec.convert`, struct instances
+    are passed through, and the result is turned into JSON-ready builtins by
+    msgspec without going through pydantic. The `response_model_*` filtering
+    options don't apply to these routes.
+    """
+
+    __slots__ = ("struct",)
+
+    def __init__(self, struct: type) -> None:
+        self.struct = struct
+
+    def validate(self, value: Any, values: Any = None, *, loc: Any = ()) -> Any:
+        if isinstance(value, dict):
+            value = msgspec.convert(value, self.struct)
+        return value, None
+
+    def serialize(self, value: Any, **kwargs: Any) -> Any:
+        return msgspec.to_builtins(value)
 
 
 class APIRoute(FastAPIRoute):
@@ -43,7 +284,11 @@ class APIRoute(FastAPIRoute):
         This flag can be used later for filtering or special treatment of these routes.
     """
 
-    is_mcp_tool: bool  # Optional type annotation for better tooling support
+    # Class-level default: only MCP tool routes carry an instance attribute.
+    is_mcp_tool: bool = False
+    # Overridden by the subclasses built in `_build_route_class`.
+    validate_response: bool = True
+    response_struct: Optional[type] = None
 
     def __init__(
         self,
@@ -56,7 +301,7 @@ class APIRoute(FastAPIRoute):
         dependencies: Optional[Sequence[params.Depends]] = None,
         summary: Optional[str] = None,
         description: Optional[str] = None,
-        response_description: str = "Successful Response",
+        response_description: str = _SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
         deprecated: Optional[bool] = None,
         name: Optional[str] = None,
@@ -70,7 +315,7 @@ class APIRoute(FastAPIRoute):
         response_model_exclude_none: bool = False,
         include_in_schema: bool = True,
         response_class: Union[Type[Response], DefaultPlaceholder] = Default(
-            JSONResponse
+            ORJSONResponse
         ),
         dependency_overrides_provider: Optional[Any] = None,
         callbacks: Optional[List[BaseRoute]] = None,
@@ -80,7 +325,8 @@ class APIRoute(FastAPIRoute):
         ] = Default(generate_unique_id),
         is_mcp_tool: bool = False,
     ):
-        self.is_mcp_tool = is_mcp_tool
+        if is_mcp_tool:
+            self.is_mcp_tool = True
         super().__init__(
             path=path,
             endpoint=endpoint,
@@ -110,6 +356,108 @@ class APIRoute(FastAPIRoute):
             generate_unique_id_function=generate_unique_id_function,
         )
 
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        response_field = self.secure_cloned_response_field
+        if self.response_struct is not None:
+            handler_field = _StructResponseField(self.response_struct)
+        elif not self.validate_response and response_field is not None:
+            handler_field = _UnvalidatedResponseField(response_field)
+        else:
+            return super().get_route_handler()
+        # FastAPI reads the response field when building the request handler,
+        # so swap in the replacement field only while the handler is built.
+        self.secure_cloned_response_field = handler_field
+        try:
+            return super().get_route_handler()
+        finally:
+            self.secure_cloned_response_field = response_field
+
+    @cached_property
+    def mcp_tool(self) -> Tool:
+        """
+        The MCP tool built from this route's endpoint.
+
+        Introspecting the endpoint (signature, argument model and JSON schema) is
+        done the first time the tool is requested and then reused, so building
+        the MCP server more than once doesn't repeat it.
+        """
+        return Tool.from_function(self.endpoint)
+
+
+def _validate_responses_by_default() -> bool:
+    """
+    The `server.validate_responses` setting of the loaded configuration.
+
+    Responses are validated when no configuration has been loaded yet.
+    """
+    config = get_loaded_config()
+    if config is None or config.server is None:
+        return True
+    return config.server.validate_responses
+
+
+@lru_cache(maxsize=None)
+def _build_route_class(
+    route_class: Type[APIRoute],
+    validate_response: bool,
+    response_struct: Optional[type],
+) -> Type[APIRoute]:
+    """
+    Return the subclass of `route_class` specialized for the given response options.
+
+    Classes are cached per combination, so all routes sharing the same options
+    share one class. A dedicated class (instead of instance attributes) keeps the
+    behavior when FastAPI rebuilds the route from `type(route)` in
+    `include_router`.
+    """
+    if (
+        getattr(route_class, "validate_response", True) == validate_response
+        and getattr(route_class, "response_struct", None) is response_struct
+    ):
+        return route_class
+    return type(
+        route_class.__name__,
+        (route_class,),
+        {
+            "validate_response": validate_response,
+            "response_struct": response_struct,
+            "__module__": route_class.__module__,
+        },
+    )
+
+
+def _is_struct(model: Any) -> bool:
+    return (
+        msgspec is not None
+        and isinstance(model, type)
+        and issubclass(model, msgspec.Struct)
+    )
+
+
+def _struct_schema(struct: type) -> Dict[str, Any]:
+    """
+    JSON schema of a msgspec `Struct`, with nested definitions inlined.
+
+    The route's OpenAPI entry has no access to the document components, so the
+    `$ref`s emitted by msgspec are resolved in place. Self-referencing structs
+    keep a reference to themselves.
+    """
+    (schema,), components = msgspec.json.schema_components(
+        (struct,), ref_template="{name}"
+    )
+
+    def inline(node: Any, seen: frozenset) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None and ref not in seen:
+                return inline(components[ref], seen | {ref})
+            return {key: inline(value, seen) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value, seen) for value in node]
+        return node
+
+    return inline(schema, frozenset())
+
 
 class RESTRouter(FastAPIRouter):
     """
@@ -200,7 +548,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#default-response-class).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -374,8 +722,21 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = Default(generate_unique_id),
+        default_exclude_unset: Annotated[
+            bool,
+            Doc(
+                """
+                Default `response_model_exclude_unset` for the *path operations* in
+                this router that don't set it explicitly.
+
+                Setting it to `True` leaves unset fields out of every response,
+                making payloads smaller and cheaper to encode.
+                """
+            ),
+        ] = False,
     ) -> None:
         self.routes_map = {}
+        self.default_exclude_unset = default_exclude_unset
         super().__init__(
             prefix=prefix,
             tags=tags,
@@ -396,7 +757,9 @@ class RESTRouter(FastAPIRouter):
             generate_unique_id_function=generate_unique_id_function,
         )
 
-    def add_api_route(self, *args, **kwargs) -> None:
+    def add_api_route(
+        self, path: str, endpoint: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
         """
         Add a new API route with optional MCP tool exposure flag.
 
@@ -405,25 +768,79 @@ class RESTRouter(FastAPIRouter):
         will be marked as part of the Model Context Protocol (MCP) tooling system.
 
         Parameters:
+            path: The URL path of the route.
+            endpoint: The callable handling the route.
             *args: Positional arguments passed directly to `add_api_route`.
             **kwargs: Keyword arguments passed directly to `add_api_route`.
                 - expose_as_mcp_tool (bool, optional): If True, marks the route
                 as part of the MCP tool interface. This flag is removed from
                 kwargs before being passed to the base method.
+                - validate_response (bool, optional): If False, the route is
+                built with a route class that skips validating return values
+                that already are `response_model` instances. When
+                left to its default, the `server.validate_responses` setting
+                applies (validation stays on unless it is disabled there).
+                - include_in_schema (bool, optional): When the route is hidden
+                from the schema, `responses`, `callbacks` and `openapi_extra` are
+                dropped since they only feed the OpenAPI document.
+                - response_model_exclude_unset (bool, optional): Falls back to
+                the router's `default_exclude_unset` when not given.
+                - response_model: A msgspec `Struct` is also accepted (when
+                msgspec is installed). Responses are then converted and encoded
+                by msgspec instead of pydantic.
 
         Behavior:
             - Delegates route creation to the superclass.
-            - Attaches the `is_mcp_tool` attribute to the most recently added route.
+            - Flags the most recently added route with `is_mcp_tool` when
+              `expose_as_mcp_tool` is True; other routes keep the class default.
 
         Example:
             @router.get("/my-tool", expose_as_mcp_tool=True)
             async def my_tool(): ...
 
         """
+        path = sys.intern(path)
         is_mcp_tool_route = kwargs.pop("expose_as_mcp_tool", False)
-        super().add_api_route(*args, **kwargs)
+        exclude_unset = kwargs.get("response_model_exclude_unset")
+        if exclude_unset is None or isinstance(exclude_unset, DefaultPlaceholder):
+            kwargs["response_model_exclude_unset"] = self.default_exclude_unset
+        in_schema = self.include_in_schema and kwargs.get("include_in_schema", True)
+        if not in_schema:
+            # Hidden routes never reach the OpenAPI schema, so don't keep their
+            # documentation-only options nor build fields for `responses` models.
+            kwargs["responses"] = kwargs["callbacks"] = kwargs["openapi_extra"] = None
+        response_model = kwargs.get("response_model")
+        is_struct = _is_struct(response_model)
+        if is_struct:
+            # FastAPI can't build a pydantic response field from a Struct: keep
+            # it out of FastAPI and document its schema as an extra response.
+            kwargs["response_model"] = None
+            if in_schema:
+                responses = dict(kwargs.get("responses") or {})
+                responses.setdefault(
+                    kwargs.get("status_code") or 200,
+                    {
+                        "content": {
+                            "application/json": {
+                                "schema": _struct_schema(response_model)
+                            }
+                        }
+                    },
+                )
+                kwargs["responses"] = responses
+        validate_response = kwargs.pop("validate_response", _DEFAULT_TRUE)
+        if isinstance(validate_response, DefaultPlaceholder):
+            validate_response = _validate_responses_by_default()
+        if is_struct or not validate_response:
+            kwargs["route_class_override"] = _build_route_class(
+                kwargs.get("route_class_override") or self.route_class,
+                validate_response,
+                response_model if is_struct else None,
+            )
+        super().add_api_route(path, endpoint, *args, **kwargs)
         last_route_added = self.routes[-1]
-        last_route_added.is_mcp_tool = is_mcp_tool_route
+        if is_mcp_tool_route:
+            last_route_added.is_mcp_tool = True
         if last_route_added.path in self.routes_map:
             logger.warning(
                 f"Route [{', '.join(last_route_added.methods)}] {last_route_added.path} was overwritten: "
@@ -450,6 +867,7 @@ class RESTRouter(FastAPIRouter):
 
         return decorator
 
+    @_route_method("GET")
     def get(
         self,
         path: Annotated[
@@ -575,7 +993,7 @@ class RESTRouter(FastAPIRouter):
                 It will be added to the generated OpenAPI (e.g. visible at `/docs`).
                 """
             ),
-        ] = "Successful Response",
+        ] = _SUCCESSFUL_RESPONSE,
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -663,13 +1081,14 @@ class RESTRouter(FastAPIRouter):
                 they will be included in the response, even if the value is the same
                 as the default.
 
-                When `True`, default values are omitted from the response.
+                When `True`, default values are omitted from the response. When not
+                given, the router's `default_exclude_unset` is used.
 
                 Read more about it in the
                 [FastAPI docs for Response Model - Return Type](https://fastapi.tiangolo.com/tutorial/response-model/#use-the-response_model_exclude_unset-parameter).
                 """
             ),
-        ] = False,
+        ] = Default(False),
         response_model_exclude_defaults: Annotated[
             bool,
             Doc(
@@ -729,7 +1148,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#redirectresponse).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         name: Annotated[
             Optional[str],
             Doc(
@@ -790,6 +1209,23 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = False,
+        validate_response: Annotated[
+            bool,
+            Doc(
+                """
+                If False, values returned by the *path operation function* that
+                already are instances of the `response_model` class are not
+                validated again. Any other value (dicts, ORM objects, lists of
+                them...) is still built into the `response_model`, so its fields
+                and the `response_model_*` filtering options always apply.
+
+                The `response_model` is still used for the OpenAPI schema.
+
+                When not given, the server's `validate_responses` setting applies,
+                which validates responses unless it is turned off.
+                """
+            ),
+        ] = Default(True),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -812,34 +1248,7 @@ class RESTRouter(FastAPIRouter):
         ```
         """
 
-        return self.api_route(
-            path=path,
-            response_model=response_model,
-            status_code=status_code,
-            tags=tags,
-            dependencies=dependencies,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            deprecated=deprecated,
-            methods=["GET"],
-            operation_id=operation_id,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-            include_in_schema=include_in_schema,
-            response_class=response_class,
-            name=name,
-            callbacks=callbacks,
-            openapi_extra=openapi_extra,
-            generate_unique_id_function=generate_unique_id_function,
-            expose_as_mcp_tool=expose_as_mcp_tool,
-        )
-
+    @_route_method("PUT")
     def put(
         self,
         path: Annotated[
@@ -965,7 +1374,7 @@ class RESTRouter(FastAPIRouter):
                 It will be added to the generated OpenAPI (e.g. visible at `/docs`).
                 """
             ),
-        ] = "Successful Response",
+        ] = _SUCCESSFUL_RESPONSE,
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -1053,13 +1462,14 @@ class RESTRouter(FastAPIRouter):
                 they will be included in the response, even if the value is the same
                 as the default.
 
-                When `True`, default values are omitted from the response.
+                When `True`, default values are omitted from the response. When not
+                given, the router's `default_exclude_unset` is used.
 
                 Read more about it in the
                 [FastAPI docs for Response Model - Return Type](https://fastapi.tiangolo.com/tutorial/response-model/#use-the-response_model_exclude_unset-parameter).
                 """
             ),
-        ] = False,
+        ] = Default(False),
         response_model_exclude_defaults: Annotated[
             bool,
             Doc(
@@ -1119,7 +1529,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#redirectresponse).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         name: Annotated[
             Optional[str],
             Doc(
@@ -1180,6 +1590,23 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = False,
+        validate_response: Annotated[
+            bool,
+            Doc(
+                """
+                If False, values returned by the *path operation function* that
+                already are instances of the `response_model` class are not
+                validated again. Any other value (dicts, ORM objects, lists of
+                them...) is still built into the `response_model`, so its fields
+                and the `response_model_*` filtering options always apply.
+
+                The `response_model` is still used for the OpenAPI schema.
+
+                When not given, the server's `validate_responses` setting applies,
+                which validates responses unless it is turned off.
+                """
+            ),
+        ] = Default(True),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -1208,34 +1635,8 @@ class RESTRouter(FastAPIRouter):
         app.include_router(router)
         ```
         """
-        return self.api_route(
-            path=path,
-            response_model=response_model,
-            status_code=status_code,
-            tags=tags,
-            dependencies=dependencies,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            deprecated=deprecated,
-            methods=["PUT"],
-            operation_id=operation_id,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-            include_in_schema=include_in_schema,
-            response_class=response_class,
-            name=name,
-            callbacks=callbacks,
-            openapi_extra=openapi_extra,
-            generate_unique_id_function=generate_unique_id_function,
-            expose_as_mcp_tool=expose_as_mcp_tool,
-        )
 
+    @_route_method("POST")
     def post(
         self,
         path: Annotated[
@@ -1361,7 +1762,7 @@ class RESTRouter(FastAPIRouter):
                 It will be added to the generated OpenAPI (e.g. visible at `/docs`).
                 """
             ),
-        ] = "Successful Response",
+        ] = _SUCCESSFUL_RESPONSE,
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -1449,13 +1850,14 @@ class RESTRouter(FastAPIRouter):
                 they will be included in the response, even if the value is the same
                 as the default.
 
-                When `True`, default values are omitted from the response.
+                When `True`, default values are omitted from the response. When not
+                given, the router's `default_exclude_unset` is used.
 
                 Read more about it in the
                 [FastAPI docs for Response Model - Return Type](https://fastapi.tiangolo.com/tutorial/response-model/#use-the-response_model_exclude_unset-parameter).
                 """
             ),
-        ] = False,
+        ] = Default(False),
         response_model_exclude_defaults: Annotated[
             bool,
             Doc(
@@ -1515,7 +1917,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#redirectresponse).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         name: Annotated[
             Optional[str],
             Doc(
@@ -1576,6 +1978,23 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = False,
+        validate_response: Annotated[
+            bool,
+            Doc(
+                """
+                If False, values returned by the *path operation function* that
+                already are instances of the `response_model` class are not
+                validated again. Any other value (dicts, ORM objects, lists of
+                them...) is still built into the `response_model`, so its fields
+                and the `response_model_*` filtering options always apply.
+
+                The `response_model` is still used for the OpenAPI schema.
+
+                When not given, the server's `validate_responses` setting applies,
+                which validates responses unless it is turned off.
+                """
+            ),
+        ] = Default(True),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -1604,34 +2023,8 @@ class RESTRouter(FastAPIRouter):
         app.include_router(router)
         ```
         """
-        return self.api_route(
-            path=path,
-            response_model=response_model,
-            status_code=status_code,
-            tags=tags,
-            dependencies=dependencies,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            deprecated=deprecated,
-            methods=["POST"],
-            operation_id=operation_id,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-            include_in_schema=include_in_schema,
-            response_class=response_class,
-            name=name,
-            callbacks=callbacks,
-            openapi_extra=openapi_extra,
-            generate_unique_id_function=generate_unique_id_function,
-            expose_as_mcp_tool=expose_as_mcp_tool,
-        )
 
+    @_route_method("DELETE")
     def delete(
         self,
         path: Annotated[
@@ -1757,7 +2150,7 @@ class RESTRouter(FastAPIRouter):
                 It will be added to the generated OpenAPI (e.g. visible at `/docs`).
                 """
             ),
-        ] = "Successful Response",
+        ] = _SUCCESSFUL_RESPONSE,
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -1845,13 +2238,14 @@ class RESTRouter(FastAPIRouter):
                 they will be included in the response, even if the value is the same
                 as the default.
 
-                When `True`, default values are omitted from the response.
+                When `True`, default values are omitted from the response. When not
+                given, the router's `default_exclude_unset` is used.
 
                 Read more about it in the
                 [FastAPI docs for Response Model - Return Type](https://fastapi.tiangolo.com/tutorial/response-model/#use-the-response_model_exclude_unset-parameter).
                 """
             ),
-        ] = False,
+        ] = Default(False),
         response_model_exclude_defaults: Annotated[
             bool,
             Doc(
@@ -1911,7 +2305,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#redirectresponse).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         name: Annotated[
             Optional[str],
             Doc(
@@ -1972,6 +2366,23 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = False,
+        validate_response: Annotated[
+            bool,
+            Doc(
+                """
+                If False, values returned by the *path operation function* that
+                already are instances of the `response_model` class are not
+                validated again. Any other value (dicts, ORM objects, lists of
+                them...) is still built into the `response_model`, so its fields
+                and the `response_model_*` filtering options always apply.
+
+                The `response_model` is still used for the OpenAPI schema.
+
+                When not given, the server's `validate_responses` setting applies,
+                which validates responses unless it is turned off.
+                """
+            ),
+        ] = Default(True),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -1993,34 +2404,8 @@ class RESTRouter(FastAPIRouter):
         app.include_router(router)
         ```
         """
-        return self.api_route(
-            path=path,
-            response_model=response_model,
-            status_code=status_code,
-            tags=tags,
-            dependencies=dependencies,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            deprecated=deprecated,
-            methods=["DELETE"],
-            operation_id=operation_id,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-            include_in_schema=include_in_schema,
-            response_class=response_class,
-            name=name,
-            callbacks=callbacks,
-            openapi_extra=openapi_extra,
-            generate_unique_id_function=generate_unique_id_function,
-            expose_as_mcp_tool=expose_as_mcp_tool,
-        )
 
+    @_route_method("PATCH")
     def patch(
         self,
         path: Annotated[
@@ -2146,7 +2531,7 @@ class RESTRouter(FastAPIRouter):
                 It will be added to the generated OpenAPI (e.g. visible at `/docs`).
                 """
             ),
-        ] = "Successful Response",
+        ] = _SUCCESSFUL_RESPONSE,
         responses: Annotated[
             Optional[Dict[Union[int, str], Dict[str, Any]]],
             Doc(
@@ -2234,13 +2619,14 @@ class RESTRouter(FastAPIRouter):
                 they will be included in the response, even if the value is the same
                 as the default.
 
-                When `True`, default values are omitted from the response.
+                When `True`, default values are omitted from the response. When not
+                given, the router's `default_exclude_unset` is used.
 
                 Read more about it in the
                 [FastAPI docs for Response Model - Return Type](https://fastapi.tiangolo.com/tutorial/response-model/#use-the-response_model_exclude_unset-parameter).
                 """
             ),
-        ] = False,
+        ] = Default(False),
         response_model_exclude_defaults: Annotated[
             bool,
             Doc(
@@ -2300,7 +2686,7 @@ class RESTRouter(FastAPIRouter):
                 [FastAPI docs for Custom Response - HTML, Stream, File, others](https://fastapi.tiangolo.com/advanced/custom-response/#redirectresponse).
                 """
             ),
-        ] = Default(JSONResponse),
+        ] = Default(ORJSONResponse),
         name: Annotated[
             Optional[str],
             Doc(
@@ -2361,6 +2747,23 @@ class RESTRouter(FastAPIRouter):
                 """
             ),
         ] = False,
+        validate_response: Annotated[
+            bool,
+            Doc(
+                """
+                If False, values returned by the *path operation function* that
+                already are instances of the `response_model` class are not
+                validated again. Any other value (dicts, ORM objects, lists of
+                them...) is still built into the `response_model`, so its fields
+                and the `response_model_*` filtering options always apply.
+
+                The `response_model` is still used for the OpenAPI schema.
+
+                When not given, the server's `validate_responses` setting applies,
+                which validates responses unless it is turned off.
+                """
+            ),
+        ] = Default(True),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -2389,33 +2792,6 @@ class RESTRouter(FastAPIRouter):
         app.include_router(router)
         ```
         """
-        return self.api_route(
-            path=path,
-            response_model=response_model,
-            status_code=status_code,
-            tags=tags,
-            dependencies=dependencies,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            deprecated=deprecated,
-            methods=["PATCH"],
-            operation_id=operation_id,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-            include_in_schema=include_in_schema,
-            response_class=response_class,
-            name=name,
-            callbacks=callbacks,
-            openapi_extra=openapi_extra,
-            generate_unique_id_function=generate_unique_id_function,
-            expose_as_mcp_tool=expose_as_mcp_tool,
-        )
 
     def http(self, *args, **kwargs):
         """
@@ -2426,6 +2802,12 @@ class RESTRouter(FastAPIRouter):
 
         return self.get(include_in_schema=False, *args, **kwargs)
 
+    fast_get = _fast_route("GET")
+    fast_put = _fast_route("PUT")
+    fast_post = _fast_route("POST")
+    fast_delete = _fast_route("DELETE")
+    fast_patch = _fast_route("PATCH")
+
 
 class MPCRouter(FastMCP):
     """
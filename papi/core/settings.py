@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -6,8 +7,42 @@ from loguru import logger
 
 from papi.core.models.config import AppConfig
 
-_config_cache: Optional[AppConfig] = None
-_config_file_path: Optional[str] = None
+# Use the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_config_file_path: Optional[Path] = None
+
+
+@lru_cache(maxsize=8)
+def _load_config(config_file_path: Path, mtime_ns: int) -> AppConfig:
+    """
+    Parse the configuration file at the given resolved path.
+
+    Memoized per path and modification time, so each version of a configuration
+    file is read and validated once.
+    """
+    logger.info(f"Loading configuration file from: {config_file_path}")
+
+    if not config_file_path.is_file():
+        logger.error(f"Configuration file not found: {config_file_path}")
+        raise FileNotFoundError(f"Configuration file not found: {config_file_path}")
+
+    try:
+        with config_file_path.open("rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        config = AppConfig(**data)
+        logger.debug("Configuration file successfully parsed and cached.")
+    except yaml.YAMLError:
+        logger.exception("Failed to parse YAML configuration file.")
+        raise
+    except Exception:
+        logger.exception("Failed to load configuration into AppConfig.")
+        raise
+
+    return config
 
 
 def get_config(config_file_path: Optional[str] = None) -> AppConfig:
@@ -16,53 +51,42 @@ def get_config(config_file_path: Optional[str] = None) -> AppConfig:
 
     Args:
         config_file_path (Optional[str]): Path to the configuration file.
-            If not provided, uses cached path or defaults to 'config.yaml'.
+            If not provided, uses the last requested path or defaults to
+            'config.yaml'.
 
     Returns:
-        AppConfig: The loaded configuration object.
+        AppConfig: The loaded configuration object. Configurations are cached
+            per resolved file path and reloaded when the file is modified.
 
     Raises:
         FileNotFoundError: If the specified config file does not exist.
         yaml.YAMLError: If the file cannot be parsed as valid YAML.
         Exception: If the data cannot be converted into an AppConfig.
     """
-    global _config_cache, _config_file_path
-
-    logger.debug("=== get_config() called ===")
-    logger.debug(f"Received config_file_path: {config_file_path}")
-    logger.debug(f"Current cached _config_file_path: {_config_file_path}")
-    logger.debug(f"Config cache status: {'filled' if _config_cache else 'empty'}")
-
-    if _config_cache is not None and config_file_path is None:
-        logger.debug("Returning cached configuration object.")
-        return _config_cache
+    global _config_file_path
 
     # Determine the effective configuration file path
     if config_file_path:
-        requested_path = Path(config_file_path).resolve()
-        _config_file_path = str(requested_path)
-    elif _config_file_path:
-        requested_path = Path(_config_file_path).resolve()
-    else:
-        requested_path = Path("config.yaml").resolve()
-        _config_file_path = str(requested_path)
+        _config_file_path = Path(config_file_path).resolve()
+    elif _config_file_path is None:
+        _config_file_path = Path("config.yaml").resolve()
 
-    logger.info(f"Loading configuration file from: {requested_path}")
+    # A single stat() per call keys the cache on the file's current version
+    try:
+        mtime_ns = _config_file_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1  # Missing file: reported by _load_config
 
-    if not requested_path.is_file():
-        logger.error(f"Configuration file not found: {requested_path}")
-        raise FileNotFoundError(f"Configuration file not found: {requested_path}")
+    return _load_config(_config_file_path, mtime_ns)
 
-    try:
-        with requested_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        _config_cache = AppConfig(**data)
-        logger.debug("Configuration file successfully parsed and cached.")
-    except yaml.YAMLError:
-        logger.exception("Failed to parse YAML configuration file.")
-        raise
-    except Exception:
-        logger.exception("Failed to load configuration into AppConfig.")
-        raise
 
-    return _config_cache
+def get_loaded_config() -> Optional[AppConfig]:
+    """
+    Return the application configuration if one has already been loaded.
+
+    Unlike `get_config`, this never falls back to reading 'config.yaml': code
+    that can run before (or without) the CLI loading a configuration gets None.
+    """
+    if _config_file_path is None:
+        return None
+    return get_config()
@@ -0,0 +1,20 @@
+from functools import lru_cache
+from typing import Any
+
+from starlette.staticfiles import StaticFiles
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles for assets that do not change while the server runs, such as the
+    `static` directories shipped with apps.
+
+    Path lookups, along with their `stat()` results, are memoized per instance,
+    so serving an already requested path does not touch the file system again.
+    Not suitable for writable directories: added, changed or deleted files are
+    not picked up until the server restarts.
+    """
+
+    def __init__(self, *args: Any, cache_size: int = 4096, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lookup_path = lru_cache(maxsize=cache_size)(super().lookup_path)